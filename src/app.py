@@ -25,58 +25,58 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     # Sports related activities
     "Soccer Team": {
         "description": "Join the school soccer team and compete in matches",
         "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 22,
-        "participants": ["alex@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"alex@mergington.edu", "lucas@mergington.edu"}
     },
     "Basketball Club": {
         "description": "Practice basketball skills and play friendly games",
         "schedule": "Mondays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["mia@mergington.edu", "noah@mergington.edu"]
+        "participants": {"mia@mergington.edu", "noah@mergington.edu"}
     },
     # Artistic activities
     "Art Workshop": {
         "description": "Explore painting, drawing, and sculpture techniques",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["ava@mergington.edu", "liam@mergington.edu"]
+        "participants": {"ava@mergington.edu", "liam@mergington.edu"}
     },
     "Drama Club": {
         "description": "Act, direct, and produce school plays and performances",
         "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["ella@mergington.edu", "jack@mergington.edu"]
+        "participants": {"ella@mergington.edu", "jack@mergington.edu"}
     },
     # Intellectual activities
     "Math Olympiad": {
         "description": "Prepare for math competitions and solve challenging problems",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["ethan@mergington.edu", "grace@mergington.edu"]
+        "participants": {"ethan@mergington.edu", "grace@mergington.edu"}
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["chloe@mergington.edu", "ben@mergington.edu"]
+        "participants": {"chloe@mergington.edu", "ben@mergington.edu"}
     }
 }
 
@@ -88,7 +88,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; serialize them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -106,7 +110,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is already signed up")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
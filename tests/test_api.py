@@ -10,49 +10,68 @@ This module contains comprehensive tests for all API endpoints:
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app, activities
-import copy
 
 
-@pytest.fixture
+def _clone_state(state):
+    """Copy an activities mapping, duplicating only the mutable participant sets."""
+    return {
+        name: {**details, "participants": set(details["participants"])}
+        for name, details in state.items()
+    }
+
+
+# Endpoint URLs used throughout the tests (Programming Class is URL-encoded on purpose)
+_CHESS = "Chess Club"
+_CHESS_SIGNUP = f"/activities/{_CHESS}/signup"
+_CHESS_UNREG = f"/activities/{_CHESS}/unregister"
+_PROGRAMMING = "Programming Class"
+_PROGRAMMING_SIGNUP = "/activities/Programming%20Class/signup"
+_PROGRAMMING_UNREG = "/activities/Programming%20Class/unregister"
+_GYM = "Gym Class"
+_GYM_SIGNUP = f"/activities/{_GYM}/signup"
+_GYM_UNREG = f"/activities/{_GYM}/unregister"
+
+# Known state the activities are reset to before each test
+_KNOWN_STATE = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    }
+}
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+    """Create a single test client for the FastAPI application, shared across the session."""
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities data before each test to ensure test isolation."""
-    # Store original activities data
-    original_activities = copy.deepcopy(activities)
-    
-    # Reset to known state before test
+    """Reset activities data to a known state before a test.
+
+    Only tests that mutate ``activities`` or depend on its exact contents
+    should request this fixture. There is no teardown: every such test
+    resets the state itself during setup.
+    """
     activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    })
-    
+    activities.update(_clone_state(_KNOWN_STATE))
     yield
-    
-    # Restore original activities data after test
-    activities.clear()
-    activities.update(original_activities)
 
 
 class TestActivitiesEndpoint:
@@ -81,8 +100,10 @@ class TestActivitiesEndpoint:
         assert chess_club["max_participants"] == 12
         assert "michael@mergington.edu" in chess_club["participants"]
         assert "daniel@mergington.edu" in chess_club["participants"]
+        # Participants are serialized as a sorted list
+        assert chess_club["participants"] == ["daniel@mergington.edu", "michael@mergington.edu"]
     
-    def test_get_activities_structure(self, client, reset_activities):
+    def test_get_activities_structure(self, client):
         """Test that activities have the correct data structure."""
         response = client.get("/activities")
         data = response.json()
@@ -100,62 +121,24 @@ class TestActivitiesEndpoint:
 class TestSignupEndpoint:
     """Test cases for POST /activities/{activity_name}/signup endpoint."""
     
-    def test_signup_success(self, client, reset_activities):
-        """Test successful signup for an activity."""
-        response = client.post(
-            "/activities/Chess Club/signup?email=new-student@mergington.edu"
-        )
+    @pytest.mark.parametrize("url,activity,email", [
+        (f"{_CHESS_SIGNUP}?email=new-student@mergington.edu",
+         _CHESS, "new-student@mergington.edu"),
+        (f"{_PROGRAMMING_SIGNUP}?email=new-student@mergington.edu",
+         _PROGRAMMING, "new-student@mergington.edu"),
+        (f"{_GYM_SIGNUP}?email=test.user@mergington.edu",
+         _GYM, "test.user@mergington.edu"),
+    ], ids=["plain", "encoded-activity", "dotted-email"])
+    def test_signup_success(self, client, reset_activities, url, activity, email):
+        """Test successful signup, including URL-encoded activity names and emails."""
+        response = client.post(url)
         
         assert response.status_code == 200
         data = response.json()
-        assert data["message"] == "Signed up new-student@mergington.edu for Chess Club"
+        assert data["message"] == f"Signed up {email} for {activity}"
         
         # Verify the student was added to the activity
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "new-student@mergington.edu" in activities_data["Chess Club"]["participants"]
-    
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signup for a non-existent activity."""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_signup_duplicate_registration(self, client, reset_activities):
-        """Test that duplicate registration is prevented."""
-        # Try to register a student who is already registered
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student is already signed up"
-    
-    def test_signup_with_encoded_activity_name(self, client, reset_activities):
-        """Test signup with URL-encoded activity names."""
-        response = client.post(
-            "/activities/Programming%20Class/signup?email=new-student@mergington.edu"
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == "Signed up new-student@mergington.edu for Programming Class"
-    
-    def test_signup_with_encoded_email(self, client, reset_activities):
-        """Test signup with URL-encoded email address."""
-        email = "test.user@mergington.edu"  # Changed from + to . to avoid URL encoding issues
-        response = client.post(
-            f"/activities/Gym Class/signup?email={email}"
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == f"Signed up {email} for Gym Class"
+        assert email in activities[activity]["participants"]
 
 
 class TestUnregisterEndpoint:
@@ -164,55 +147,63 @@ class TestUnregisterEndpoint:
     def test_unregister_success(self, client, reset_activities):
         """Test successful unregistration from an activity."""
         # First verify the student is registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" in activities[_CHESS]["participants"]
         
         # Unregister the student
         response = client.delete(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
+            f"{_CHESS_UNREG}?email=michael@mergington.edu"
         )
         
         assert response.status_code == 200
         data = response.json()
-        assert data["message"] == "Unregistered michael@mergington.edu from Chess Club"
+        assert data["message"] == f"Unregistered michael@mergington.edu from {_CHESS}"
         
         # Verify the student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in activities[_CHESS]["participants"]
         # Verify other student is still there
-        assert "daniel@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "daniel@mergington.edu" in activities[_CHESS]["participants"]
     
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
-        """Test unregistration from a non-existent activity."""
+    def test_unregister_with_encoded_activity_name(self, client, reset_activities):
+        """Test unregistration with URL-encoded activity names."""
         response = client.delete(
-            "/activities/Nonexistent Activity/unregister?email=student@mergington.edu"
+            f"{_PROGRAMMING_UNREG}?email=emma@mergington.edu"
         )
         
-        assert response.status_code == 404
+        assert response.status_code == 200
         data = response.json()
-        assert data["detail"] == "Activity not found"
+        assert data["message"] == f"Unregistered emma@mergington.edu from {_PROGRAMMING}"
+
+
+class TestErrorResponses:
+    """Error cases shared by the signup and unregister endpoints."""
     
-    def test_unregister_not_registered_student(self, client, reset_activities):
-        """Test unregistration of a student who is not registered."""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=not-registered@mergington.edu"
+    @pytest.mark.parametrize("method,suffix", [
+        ("post", "signup"),
+        ("delete", "unregister"),
+    ], ids=["signup", "unregister"])
+    def test_nonexistent_activity(self, client, method, suffix):
+        """Test signup/unregistration for a non-existent activity."""
+        response = getattr(client, method)(
+            f"/activities/Nonexistent Activity/{suffix}?email=student@mergington.edu"
         )
         
-        assert response.status_code == 400
+        assert response.status_code == 404
         data = response.json()
-        assert data["detail"] == "Student is not registered for this activity"
+        assert data["detail"] == "Activity not found"
     
-    def test_unregister_with_encoded_activity_name(self, client, reset_activities):
-        """Test unregistration with URL-encoded activity names."""
-        response = client.delete(
-            "/activities/Programming%20Class/unregister?email=emma@mergington.edu"
-        )
+    @pytest.mark.parametrize("method,url,email,detail", [
+        ("post", _CHESS_SIGNUP, "michael@mergington.edu",
+         "Student is already signed up"),
+        ("delete", _CHESS_UNREG, "not-registered@mergington.edu",
+         "Student is not registered for this activity"),
+    ], ids=["duplicate-signup", "unregister-not-registered"])
+    def test_registration_state_mismatch(self, client, reset_activities, method, url, email, detail):
+        """Test duplicate signup and unregistration of a student who is not registered."""
+        response = getattr(client, method)(f"{url}?email={email}")
         
-        assert response.status_code == 200
+        assert response.status_code == 400
         data = response.json()
-        assert data["message"] == "Unregistered emma@mergington.edu from Programming Class"
+        assert data["detail"] == detail
 
 
 class TestRootEndpoint:
@@ -231,34 +222,28 @@ class TestIntegrationScenarios:
     def test_signup_and_unregister_workflow(self, client, reset_activities):
         """Test complete workflow: signup then unregister."""
         email = "workflow-test@mergington.edu"
-        activity = "Chess Club"
+        activity = _CHESS
         
         # Initial state - student not registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(f"{_CHESS_SIGNUP}?email={email}")
         assert signup_response.status_code == 200
         
         # Verify registration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in activities[activity]["participants"]
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        unregister_response = client.delete(f"{_CHESS_UNREG}?email={email}")
         assert unregister_response.status_code == 200
         
         # Verify unregistration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
     
     def test_multiple_students_same_activity(self, client, reset_activities):
         """Test multiple students signing up for the same activity."""
-        activity = "Gym Class"
+        activity = _GYM
         students = [
             "student1@mergington.edu",
             "student2@mergington.edu",
@@ -267,22 +252,18 @@ class TestIntegrationScenarios:
         
         # Sign up all students
         for student in students:
-            response = client.post(f"/activities/{activity}/signup?email={student}")
+            response = client.post(f"{_GYM_SIGNUP}?email={student}")
             assert response.status_code == 200
         
         # Verify all are registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
         for student in students:
-            assert student in activities_data[activity]["participants"]
+            assert student in activities[activity]["participants"]
         
         # Unregister middle student
-        response = client.delete(f"/activities/{activity}/unregister?email={students[1]}")
+        response = client.delete(f"{_GYM_UNREG}?email={students[1]}")
         assert response.status_code == 200
         
         # Verify only middle student is removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert students[0] in activities_data[activity]["participants"]
-        assert students[1] not in activities_data[activity]["participants"]
-        assert students[2] in activities_data[activity]["participants"]
\ No newline at end of file
+        assert students[0] in activities[activity]["participants"]
+        assert students[1] not in activities[activity]["participants"]
+        assert students[2] in activities[activity]["participants"]
\ No newline at end of file